@@ -6,43 +6,201 @@ This script simulates how different ATS systems parse resumes
 and provides specific recommendations for optimization.
 """
 
-import PyPDF2
 import pdfplumber
+import os
 import re
 import json
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 import argparse
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Patterns are compiled once at import time rather than on every parse call
+# Name and location alternatives folded into one zero-width union, so a single
+# finditer pass reports every position together with the highest-priority
+# alternative that matches there. The alternatives are mutually exclusive at
+# any one position except state/city, where state wins as before. (A three-word
+# name or "Location: City, ST" always implies an earlier-priority match.)
+_NAME_LOCATION_RE = re.compile(
+    r'(?=^(?P<name>[A-Z][a-z]+ [A-Z][a-z]+)'
+    r'|Name:\s*(?P<labeled_name>[A-Z][a-z]+ [A-Z][a-z]+)'
+    r'|(?P<state>[A-Z][a-z]+,\s*[A-Z]{2})'
+    r'|(?P<city>[A-Z][a-z]+,\s*[A-Z][a-z]+))',
+    re.MULTILINE
+)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Optional parentheses make this a superset of the plain-digits form, so one search suffices
+_PHONE_RE = re.compile(r'(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/([a-zA-Z0-9-]+)', re.IGNORECASE)
+_DEGREE_RES = [
+    re.compile(r'([A-Z][^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)'),
+    re.compile(r'([A-Z][^|]+)\s*\|\s*([^|]+)'),
+    re.compile(r'([A-Z][^|]+)')
+]
+_SKILL_SPLIT_RE = re.compile(r'[•·|]')
+# Tokenizes a stripped line as a header ("Title: ...") or a bullet in one match
+_LINE_TOKEN_RE = re.compile(r'(?P<header>[A-Z][^:]+:)|(?P<bullet>[•*\-·])')
+_SKILL_SEPARATORS = frozenset('•·|')
+_WHITESPACE_RE = re.compile(r'\s+')
+# Ampersands and special bullet points rewritten by generate_ats_optimized_version
+_ATS_CHAR_TABLE = str.maketrans({'&': 'and', '•': '*', '◦': '*', '·': '*'})
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+# Section keywords whose line positions are indexed once per extracted text
+_SECTION_KEYWORDS = ('work experience', 'education', 'skills')
+
+# Extracted text is cached next to the PDF, keyed by its mtime and size and the
+# backend that produced it. Bump the version whenever extraction output changes
+_TEXT_CACHE_SUFFIX = '.atscache'
+_TEXT_CACHE_VERSION = 1
+
+# Page-parallel extraction settings for the pdfplumber path
+_MIN_PARALLEL_PAGES = 3
+_MAX_PAGES_PER_BATCH = 10
+
+def _get_max_workers(page_count: int) -> int:
+    """Number of worker processes worth spawning for page_count pages"""
+    return max(1, min(os.cpu_count() or 1, page_count))
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> List[str]:
+    """Extract the text of pages [start, end) (runs in a worker process)"""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page.extract_text() or '' for page in pdf.pages[start:end]]
+
+def _write_json(results: Dict[str, Any], output_path: str):
+    """Write results as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(results, f, indent=2)
+
 class AdvancedATSTester:
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, use_cache: bool = True):
         self.pdf_path = pdf_path
-        self.text = ""
-        self.parsed_sections = {}
+        self.use_cache = use_cache
+        self.text: str = ""
+        self.parsed_sections: Dict[str, Any] = {}
+        # Line caches built by _index_text for the text in _indexed_text
+        self._indexed_text: Optional[str] = None
+        self._lines: List[str] = []
+        self._lines_lower: List[str] = []
+        self._tokens: List[Tuple[Optional[str], str]] = []
+        self._section_index: Dict[str, List[int]] = {}
         
     def extract_text(self):
         """Extract text using the best available method"""
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                full_text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        full_text += page_text + "\n"
-                self.text = full_text
-                return True
+            cache_path = Path(self.pdf_path + _TEXT_CACHE_SUFFIX)
+            backend = 'pymupdf' if fitz is not None else 'pdfplumber'
+            if self.use_cache:
+                cached_text = self._load_cached_text(cache_path, self._text_cache_key(backend))
+                if cached_text is not None:
+                    self.text = cached_text
+                    self._index_text()
+                    return True
+            
+            text = None
+            if fitz is not None:
+                try:
+                    text = self._extract_text_pymupdf()
+                except Exception as e:
+                    print(f"PyMuPDF extraction failed, falling back to pdfplumber: {e}")
+            if text is None:
+                backend = 'pdfplumber'
+                text = self._extract_text_pdfplumber()
+            self.text = text
+            self._index_text()
+            if self.use_cache:
+                self._save_cached_text(cache_path, self._text_cache_key(backend))
+            return True
         except Exception as e:
             print(f"Error extracting text: {e}")
             return False
     
+    def _text_cache_key(self, backend: str) -> str:
+        """Key identifying the current version of the PDF on disk and the extractor used"""
+        stat = os.stat(self.pdf_path)
+        return f"{stat.st_mtime_ns}-{stat.st_size}-{backend}-v{_TEXT_CACHE_VERSION}"
+    
+    def _load_cached_text(self, cache_path: Path, cache_key: str) -> Optional[str]:
+        """Return previously extracted text if the cache matches cache_key"""
+        try:
+            with open(cache_path, 'r', encoding='utf-8', newline='') as f:
+                if f.readline() != cache_key + '\n':
+                    return None
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+    
+    def _save_cached_text(self, cache_path: Path, cache_key: str):
+        """Store the extracted text for later runs (best effort)"""
+        try:
+            with open(cache_path, 'w', encoding='utf-8', newline='') as f:
+                f.write(cache_key + '\n')
+                f.write(self.text)
+        except OSError as e:
+            print(f"Warning: could not write text cache {cache_path}: {e}")
+    
+    def _extract_text_pymupdf(self) -> str:
+        """Extract text with PyMuPDF (MuPDF-backed, much faster than pdfminer)"""
+        chunks = []
+        with fitz.open(self.pdf_path) as doc:
+            for page in doc:
+                page_text = page.get_text("text")
+                if page_text:
+                    chunks.append(page_text + "\n")
+        return "".join(chunks)
+    
+    def _extract_text_pdfplumber(self) -> str:
+        """Extract text with pdfplumber, splitting long documents across processes"""
+        chunks = []
+        with pdfplumber.open(self.pdf_path) as pdf:
+            page_count = len(pdf.pages)
+            workers = _get_max_workers(page_count)
+            if page_count < _MIN_PARALLEL_PAGES or workers == 1:
+                for page in pdf.pages:
+                    page_text = page.extract_text()
+                    if page_text:
+                        chunks.append(page_text + "\n")
+                    # Drop cached layout objects so memory stays bounded per page
+                    page.flush_cache()
+                    if hasattr(page.get_textmap, 'cache_clear'):
+                        page.get_textmap.cache_clear()
+                return "".join(chunks)
+        
+        # Each worker opens the PDF itself and extracts a contiguous page range
+        batch_size = min(_MAX_PAGES_PER_BATCH, -(-page_count // workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_extract_page_range, self.pdf_path, start, min(start + batch_size, page_count))
+                for start in range(0, page_count, batch_size)
+            ]
+            for future in futures:
+                chunks.extend(page_text + "\n" for page_text in future.result() if page_text)
+        return "".join(chunks)
+    
     def simulate_ats_parsing(self) -> Dict[str, Any]:
         """Simulate how different ATS systems parse the resume"""
-        results = {
-            'contact_info': self._parse_contact_info(),
+        contact = self._parse_contact_info()
+        results: Dict[str, Any] = {
+            'contact_info': contact,
             'work_experience': self._parse_work_experience(),
             'education': self._parse_education(),
             'skills': self._parse_skills(),
-            'ats_issues': self._identify_ats_issues(),
+            'ats_issues': self._identify_ats_issues(contact),
             'optimization_score': 0
         }
         
@@ -64,7 +222,7 @@ class AdvancedATSTester:
     
     def _parse_contact_info(self) -> Dict[str, Any]:
         """Parse contact information as ATS would"""
-        contact = {
+        contact: Dict[str, Any] = {
             'name': '',
             'email': '',
             'phone': '',
@@ -73,53 +231,29 @@ class AdvancedATSTester:
             'complete': False
         }
         
-        # Extract name (usually first line or after "Name:")
-        name_patterns = [
-            r'^([A-Z][a-z]+ [A-Z][a-z]+)',
-            r'Name:\s*([A-Z][a-z]+ [A-Z][a-z]+)',
-            r'^([A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+)'
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, self.text, re.MULTILINE)
-            if match:
-                contact['name'] = match.group(1)
-                break
+        # Extract name (usually first line or after "Name:") and location in one pass
+        found: Dict[str, str] = {}
+        for match in _NAME_LOCATION_RE.finditer(self.text):
+            kind = match.lastgroup
+            if kind and kind not in found:
+                found[kind] = match.group(kind)
+                if 'name' in found and 'state' in found:
+                    break
+        contact['name'] = found.get('name') or found.get('labeled_name', '')
+        contact['location'] = found.get('state') or found.get('city', '')
         
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, self.text)
+        email_match = _EMAIL_RE.search(self.text)
         if email_match:
             contact['email'] = email_match.group(0)
         
         # Extract phone
-        phone_patterns = [
-            r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})',
-            r'(\+?1[-.\s]?)?([0-9]{3})[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'
-        ]
-        
-        for pattern in phone_patterns:
-            phone_match = re.search(pattern, self.text)
-            if phone_match:
-                contact['phone'] = phone_match.group(0)
-                break
-        
-        # Extract location
-        location_patterns = [
-            r'([A-Z][a-z]+,\s*[A-Z]{2})',
-            r'([A-Z][a-z]+,\s*[A-Z][a-z]+)',
-            r'Location:\s*([A-Z][a-z]+,\s*[A-Z]{2})'
-        ]
-        
-        for pattern in location_patterns:
-            location_match = re.search(pattern, self.text)
-            if location_match:
-                contact['location'] = location_match.group(1)
-                break
+        phone_match = _PHONE_RE.search(self.text)
+        if phone_match:
+            contact['phone'] = phone_match.group(0)
         
         # Extract LinkedIn
-        linkedin_pattern = r'linkedin\.com/in/([a-zA-Z0-9-]+)'
-        linkedin_match = re.search(linkedin_pattern, self.text, re.IGNORECASE)
+        linkedin_match = _LINKEDIN_RE.search(self.text)
         if linkedin_match:
             contact['linkedin'] = linkedin_match.group(1)
         
@@ -132,35 +266,27 @@ class AdvancedATSTester:
     
     def _parse_work_experience(self) -> Dict[str, Any]:
         """Parse work experience as ATS would"""
-        experience = {
+        experience: Dict[str, Any] = {
             'jobs': [],
             'parsed_well': False,
             'issues': []
         }
         
         # Look for work experience section
-        work_section = self._extract_section('work experience', 'education')
-        if not work_section:
+        bounds = self._section_bounds('work experience', 'education')
+        if bounds is None:
             experience['issues'].append("Work experience section not found")
             return experience
         
         # Parse individual jobs
-        job_patterns = [
-            r'([A-Z][^:]+)\s*:\s*([^|]+)\|\s*([^|]+)',
-            r'([A-Z][^:]+)\s*:\s*([^|]+)\|\s*([^|]+)',
-            r'([A-Z][^:]+)\s*:\s*([^|]+)\|\s*([^|]+)'
-        ]
+        current_job: Optional[Dict[str, Any]] = None
         
-        lines = work_section.split('\n')
-        current_job = None
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
+        for kind, line in self._tokens[bounds[0]:bounds[1]]:
+            if kind is None:
                 continue
             
             # Check if this looks like a job title
-            if re.match(r'^[A-Z][^:]+:', line):
+            if kind == 'header':
                 if current_job:
                     experience['jobs'].append(current_job)
                 
@@ -191,7 +317,7 @@ class AdvancedATSTester:
                     }
             
             # Check if this looks like an achievement
-            elif current_job and (line.startswith('•') or line.startswith('*') or line.startswith('-') or line.startswith('·')):
+            elif current_job:
                 achievement = line.lstrip('•*-·').strip()
                 if achievement:
                     current_job['achievements'].append(achievement)
@@ -211,34 +337,26 @@ class AdvancedATSTester:
     
     def _parse_education(self) -> Dict[str, Any]:
         """Parse education as ATS would"""
-        education = {
+        education: Dict[str, Any] = {
             'institutions': [],
             'parsed_well': False,
             'issues': []
         }
         
         # Look for education section
-        edu_section = self._extract_section('education', 'skills')
-        if not edu_section:
+        bounds = self._section_bounds('education', 'skills')
+        if bounds is None:
             education['issues'].append("Education section not found")
             return education
         
         # Parse education entries
-        lines = edu_section.split('\n')
-        for line in lines:
-            line = line.strip()
+        for _, line in self._tokens[bounds[0]:bounds[1]]:
             if not line:
                 continue
             
             # Look for degree and institution patterns
-            degree_patterns = [
-                r'([A-Z][^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)',
-                r'([A-Z][^|]+)\s*\|\s*([^|]+)',
-                r'([A-Z][^|]+)'
-            ]
-            
-            for pattern in degree_patterns:
-                match = re.search(pattern, line)
+            for pattern in _DEGREE_RES:
+                match = pattern.search(line)
                 if match:
                     groups = match.groups()
                     institution = {
@@ -259,29 +377,27 @@ class AdvancedATSTester:
     
     def _parse_skills(self) -> Dict[str, Any]:
         """Parse skills as ATS would"""
-        skills = {
+        skills: Dict[str, Any] = {
             'skill_categories': [],
             'parsed_well': False,
             'issues': []
         }
         
         # Look for skills section
-        skills_section = self._extract_section('skills', '')
-        if not skills_section:
+        bounds = self._section_bounds('skills', '')
+        if bounds is None:
             skills['issues'].append("Skills section not found")
             return skills
         
         # Parse skill categories
-        lines = skills_section.split('\n')
-        current_category = None
+        current_category: Optional[Dict[str, Any]] = None
         
-        for line in lines:
-            line = line.strip()
+        for kind, line in self._tokens[bounds[0]:bounds[1]]:
             if not line:
                 continue
             
             # Check if this looks like a skill category header
-            if re.match(r'^[A-Z][^:]+:', line):
+            if kind == 'header':
                 if current_category:
                     skills['skill_categories'].append(current_category)
                 
@@ -292,9 +408,9 @@ class AdvancedATSTester:
                 }
             
             # Check if this looks like skills list
-            elif current_category and ('•' in line or '·' in line or '|' in line):
+            elif current_category and not _SKILL_SEPARATORS.isdisjoint(line):
                 # Split by common separators
-                skill_items = re.split(r'[•·|]', line)
+                skill_items = _SKILL_SPLIT_RE.split(line)
                 for item in skill_items:
                     item = item.strip()
                     if item:
@@ -313,82 +429,119 @@ class AdvancedATSTester:
         
         return skills
     
-    def _extract_section(self, start_keyword: str, end_keyword: str) -> str:
-        """Extract a specific section from the resume text"""
-        lines = self.text.split('\n')
-        start_idx = -1
-        end_idx = len(lines)
+    def _index_text(self):
+        """Split the text into lines, tokenize each line and record where each section keyword appears"""
+        self._indexed_text = self.text
+        self._lines = self.text.split('\n')
+        self._lines_lower = self.text.lower().split('\n')
+        self._tokens = []
+        self._section_index = {keyword: [] for keyword in _SECTION_KEYWORDS}
+        
+        # Bound once rather than looked up on every line
+        match_token = _LINE_TOKEN_RE.match
+        append_token = self._tokens.append
+        for i, line in enumerate(self._lines):
+            stripped = line.strip()
+            token_match = match_token(stripped)
+            append_token((token_match.lastgroup if token_match else None, stripped))
+            
+            line_lower = self._lines_lower[i]
+            for keyword in _SECTION_KEYWORDS:
+                if keyword in line_lower:
+                    self._section_index[keyword].append(i)
+    
+    def _find_keyword_line(self, keyword: str, start: int) -> int:
+        """Return the first line index >= start containing keyword, or -1"""
+        keyword = keyword.lower()
+        positions = self._section_index.get(keyword)
+        if positions is not None:
+            pos = bisect_left(positions, start)
+            return positions[pos] if pos < len(positions) else -1
+        
+        # Keyword is not indexed, fall back to a linear scan
+        for i in range(start, len(self._lines_lower)):
+            if keyword in self._lines_lower[i]:
+                return i
+        return -1
+    
+    def _section_bounds(self, start_keyword: str, end_keyword: str) -> Optional[Tuple[int, int]]:
+        """Return the (start, end) line range of a section, or None if it is missing"""
+        if self._indexed_text is not self.text:
+            self._index_text()
         
         # Find start of section
-        for i, line in enumerate(lines):
-            if start_keyword.lower() in line.lower():
-                start_idx = i
-                break
-        
+        start_idx = self._find_keyword_line(start_keyword, 0)
         if start_idx == -1:
-            return ""
+            return None
         
         # Find end of section
+        end_idx = len(self._lines)
         if end_keyword:
-            for i in range(start_idx + 1, len(lines)):
-                if end_keyword.lower() in lines[i].lower():
-                    end_idx = i
-                    break
+            found = self._find_keyword_line(end_keyword, start_idx + 1)
+            if found != -1:
+                end_idx = found
         
-        # Extract section
-        section_lines = lines[start_idx:end_idx]
-        return '\n'.join(section_lines)
+        return start_idx, end_idx
+    
+    def _extract_section(self, start_keyword: str, end_keyword: str) -> str:
+        """Extract a specific section from the resume text"""
+        bounds = self._section_bounds(start_keyword, end_keyword)
+        if bounds is None:
+            return ""
+        return '\n'.join(self._lines[bounds[0]:bounds[1]])
     
-    def _identify_ats_issues(self) -> List[str]:
+    def _identify_ats_issues(self, contact: Dict[str, Any]) -> List[str]:
         """Identify specific ATS parsing issues"""
         issues = []
         
-        # Check for problematic characters
-        if '&' in self.text:
+        # Check for problematic characters (one pass to collect the distinct characters)
+        chars = set(self.text)
+        if '&' in chars:
             issues.append("Ampersands (&) should be written as 'and' for better ATS compatibility")
         
-        if '•' in self.text or '◦' in self.text:
+        if not chars.isdisjoint('•◦'):
             issues.append("Special bullet points may not parse well in some ATS systems")
         
-        if re.search(r'[^\x00-\x7F]', self.text):
+        if not self.text.isascii():
             issues.append("Non-ASCII characters may cause ATS parsing issues")
         
         # Check for formatting issues
         if self.text.count('\n') > 100:
             issues.append("Too many line breaks may confuse ATS parsing")
         
-        # Check for missing contact info
-        if not re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', self.text):
+        # Check for missing contact info (already searched by _parse_contact_info)
+        if not contact['email']:
             issues.append("Email address not found - critical for ATS")
         
-        if not re.search(r'(\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}', self.text):
+        if not contact['phone']:
             issues.append("Phone number not found - important for ATS")
         
-        # Check for consistent formatting
-        lines = [line.strip() for line in self.text.split('\n') if line.strip()]
-        if len(set(len(line) for line in lines)) > 10:
-            issues.append("Inconsistent line lengths may confuse ATS parsing")
+        # Check for consistent formatting (stop as soon as 11 distinct lengths are seen)
+        if self._indexed_text is not self.text:
+            self._index_text()
+        line_lengths = set()
+        for line in self._lines:
+            length = len(line.strip())
+            if length:
+                line_lengths.add(length)
+                if len(line_lengths) > 10:
+                    issues.append("Inconsistent line lengths may confuse ATS parsing")
+                    break
         
         return issues
     
     def generate_ats_optimized_version(self) -> str:
         """Generate an ATS-optimized version of the resume"""
-        optimized_text = self.text
-        
-        # Replace ampersands
-        optimized_text = optimized_text.replace('&', 'and')
-        
-        # Replace special bullet points
-        optimized_text = optimized_text.replace('•', '*')
-        optimized_text = optimized_text.replace('◦', '*')
-        optimized_text = optimized_text.replace('·', '*')
-        
-        # Remove non-ASCII characters
-        optimized_text = ''.join(char if ord(char) < 128 else ' ' for char in optimized_text)
+        # Replace ampersands and special bullet points, and blank out any other
+        # non-ASCII characters, in a single translate pass (the non-ASCII part of
+        # the table only covers code points actually present)
+        table = {ord(char): ' ' for char in set(self.text) if ord(char) > 127}
+        table.update(_ATS_CHAR_TABLE)
+        optimized_text = self.text.translate(table)
         
         # Normalize whitespace
-        optimized_text = re.sub(r'\s+', ' ', optimized_text)
-        optimized_text = re.sub(r'\n\s*\n', '\n\n', optimized_text)
+        optimized_text = _WHITESPACE_RE.sub(' ', optimized_text)
+        optimized_text = _BLANK_LINES_RE.sub('\n\n', optimized_text)
         
         return optimized_text
     
@@ -488,6 +641,7 @@ def main():
     parser = argparse.ArgumentParser(description='Advanced ATS testing for PDF resumes')
     parser.add_argument('pdf_path', help='Path to the PDF resume file')
     parser.add_argument('--output', '-o', help='Output file for JSON results')
+    parser.add_argument('--no-cache', action='store_true', help='Re-extract text even if a cached copy exists')
     
     args = parser.parse_args()
     
@@ -495,13 +649,12 @@ def main():
         print(f"Error: File {args.pdf_path} not found")
         return
     
-    tester = AdvancedATSTester(args.pdf_path)
+    tester = AdvancedATSTester(args.pdf_path, use_cache=not args.no_cache)
     results = tester.run_advanced_test()
     tester.print_advanced_results(results)
     
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(results, f, indent=2)
+        _write_json(results, args.output)
         print(f"\nDetailed results saved to: {args.output}")
 
 if __name__ == "__main__":
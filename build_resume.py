@@ -6,15 +6,22 @@ This script builds both the visual PDF and ATS-optimized text from the Markdown
 It integrates the ATS text generation into the existing workflow.
 """
 
+import contextlib
+import importlib
+import io
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+TEX_FILE = "harris_resume_ats_optimized.tex"
+BUILD_DIR = Path("build")
+
 def run_command(command, description):
-    """Run a command and handle errors"""
+    """Run a command (an argument list, no shell) and handle errors"""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -22,15 +29,33 @@ def run_command(command, description):
         print(f"   Error: {e.stderr}")
         return False
 
+def run_step(step, description):
+    """Run a Python build step in this process, capturing its output like run_command"""
+    print(f"🔄 {description}...")
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            step()
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            print(f"❌ {description} failed:")
+            print(f"   Error: exited with status {e.code}")
+            return False
+    except Exception as e:
+        print(f"❌ {description} failed:")
+        print(f"   Error: {e}")
+        return False
+    
+    print(f"✅ {description} completed successfully")
+    return True
+
 def check_dependencies():
     """Check if required dependencies are available"""
     print("🔍 Checking dependencies...")
     
     # Check if XeLaTeX is available
-    try:
-        subprocess.run("which xelatex", shell=True, check=True, capture_output=True)
+    if shutil.which("xelatex"):
         print("✅ XeLaTeX found")
-    except subprocess.CalledProcessError:
+    else:
         print("❌ XeLaTeX not found. Please install TeX Live.")
         return False
     
@@ -51,22 +76,36 @@ def check_dependencies():
 
 def generate_ats_text():
     """Generate ATS-optimized text from Markdown"""
-    return run_command("python simple_ats_converter.py", "Generating ATS-optimized text")
+    # Imported inside the step so a broken module fails only this step
+    return run_step(lambda: importlib.import_module("simple_ats_converter").main(), "Generating ATS-optimized text")
 
 def test_ats_text():
     """Test the generated ATS text"""
-    return run_command("python test_ats_text.py", "Testing ATS text compatibility")
+    return run_step(lambda: importlib.import_module("test_ats_text").main(), "Testing ATS text compatibility")
 
 def compile_latex():
     """Compile LaTeX to PDF"""
-    # First compilation
-    if not run_command("xelatex harris_resume_ats_optimized.tex", "First LaTeX compilation"):
-        return False
+    BUILD_DIR.mkdir(exist_ok=True)
     
-    # Second compilation for cross-references
-    if not run_command("xelatex harris_resume_ats_optimized.tex", "Second LaTeX compilation"):
-        return False
+    if shutil.which("latexmk"):
+        # latexmk reruns XeLaTeX only while cross-references are still changing
+        command = ["latexmk", "-xelatex", "-interaction=nonstopmode", f"-output-directory={BUILD_DIR}", TEX_FILE]
+        if not run_command(command, "LaTeX compilation (latexmk)"):
+            return False
+    else:
+        command = ["xelatex", "-interaction=nonstopmode", f"-output-directory={BUILD_DIR}", TEX_FILE]
+        
+        # First compilation
+        if not run_command(command, "First LaTeX compilation"):
+            return False
+        
+        # Second compilation for cross-references
+        if not run_command(command, "Second LaTeX compilation"):
+            return False
     
+    # Keep the PDF next to the sources where the rest of the workflow expects it
+    pdf_name = Path(TEX_FILE).with_suffix(".pdf").name
+    shutil.copy2(BUILD_DIR / pdf_name, pdf_name)
     return True
 
 def test_pdf_ats():
@@ -75,7 +114,13 @@ def test_pdf_ats():
         print("🔄 Testing PDF with ATS scripts...")
         
         # Test with basic ATS script
-        if run_command("python ats_testing_script.py harris_resume_ats_optimized.pdf", "Basic ATS test"):
+        def basic_ats_test():
+            from ats_testing_script import ATSResumeTester
+            tester = ATSResumeTester("harris_resume_ats_optimized.pdf")
+            tester.run_all_tests()
+            tester.print_results()
+        
+        if run_step(basic_ats_test, "Basic ATS test"):
             print("✅ PDF ATS test completed")
         else:
             print("⚠️ PDF ATS test had issues, but ATS text is optimized")
@@ -88,13 +133,13 @@ def test_pdf_ats():
 def cleanup():
     """Clean up auxiliary files"""
     print("🧹 Cleaning up auxiliary files...")
-    aux_files = ["*.aux", "*.log", "*.out", "*.toc", "*.fdb_latexmk", "*.fls", "*.synctex.gz"]
+    shutil.rmtree(BUILD_DIR, ignore_errors=True)
     
+    # Remove leftovers from manual compiles in the project root
+    aux_files = ["*.aux", "*.log", "*.out", "*.toc", "*.fdb_latexmk", "*.fls", "*.synctex.gz"]
     for pattern in aux_files:
-        try:
-            subprocess.run(f"rm -f {pattern}", shell=True, check=True)
-        except subprocess.CalledProcessError:
-            pass  # Ignore errors for cleanup
+        for path in Path(".").glob(pattern):
+            path.unlink(missing_ok=True)
     
     print("✅ Cleanup completed")
 
@@ -9,11 +9,17 @@ to show the improvement achieved.
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def load_json_file(filename):
-    """Load JSON file safely"""
-    if Path(filename).exists():
-        with open(filename, 'r') as f:
-            return json.load(f)
+    """Load JSON file safely, using orjson when it is installed"""
+    path = Path(filename)
+    if path.exists():
+        data = path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
     return None
 
 def compare_results():
@@ -59,20 +65,22 @@ def compare_results():
     print(f"  Optimized: {len(optimized_skills['skill_categories'])} categories, {'✅' if optimized_skills['parsed_well'] else '❌'} parsed")
     
     print("\n⚠️ ATS ISSUES:")
-    original_issues = len(original_results['ats_issues'])
-    optimized_issues = len(optimized_results['ats_issues'])
+    original_issue_list = original_results['ats_issues']
+    optimized_issue_list = optimized_results['ats_issues']
+    original_issues = len(original_issue_list)
+    optimized_issues = len(optimized_issue_list)
     
     print(f"  Original: {original_issues} issues")
     print(f"  Optimized: {optimized_issues} issues")
     
     if original_issues > 0:
         print("  Original issues:")
-        for i, issue in enumerate(original_results['ats_issues'], 1):
+        for i, issue in enumerate(original_issue_list, 1):
             print(f"    {i}. {issue}")
     
     if optimized_issues > 0:
         print("  Optimized issues:")
-        for i, issue in enumerate(optimized_results['ats_issues'], 1):
+        for i, issue in enumerate(optimized_issue_list, 1):
             print(f"    {i}. {issue}")
     else:
         print("  ✅ No issues in optimized version!")
@@ -6,103 +6,238 @@ This script compares the original resume with the ATS-optimized version
 to show the differences and improvements.
 """
 
-import PyPDF2
 import pdfplumber
+import hashlib
 import re
 from pathlib import Path
 
-def extract_text_from_pdf(pdf_path):
-    """Extract text from PDF using pdfplumber"""
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:
+    import re2  # google-re2
+except ImportError:
+    re2 = None
+
+# Patterns are compiled once at import time rather than on every analyze_text call
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s@.-]')
+
+# Deletes every ASCII character _SPECIAL_CHARS_RE allows, leaving only candidates to count
+_ALLOWED_ASCII_TABLE = dict.fromkeys(
+    i for i in range(128) if not _SPECIAL_CHARS_RE.match(chr(i))
+)
+_SPECIAL_BULLETS = frozenset('•◦·')
+
+# Extracted text is cached here, keyed by a hash of the PDF's contents
+_TEXT_CACHE_DIR = Path('.ats_cache')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_RE = re.compile(r'(\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}')
+
+def _build_contact_set():
+    """Compile the email and phone patterns into one RE2 set (one DFA pass), or None without re2"""
+    if re2 is None:
+        return None
+    
+    # RE2's \s leaves out \v and \x1c-\x1f, which Python's matches, so spell the class out
+    contact_set = re2.Set.SearchSet(re2.Options())
+    contact_set.Add(_EMAIL_RE.pattern)
+    contact_set.Add(_PHONE_RE.pattern.replace(r'\s', r'\t\n\v\f\r\x1c-\x1f '))
+    contact_set.Compile()
+    return contact_set
+
+# Every email has an '@' and every phone number has ASCII digits, so text
+# without them can skip the regex engines entirely
+_DIGITS = '0123456789'
+
+# Only used on ASCII text: for anything else RE2's ASCII-only \b can disagree with Python's
+_CONTACT_SET = _build_contact_set()
+
+def _extract_text_sequential(pdf_path):
+    """Extract text from PDF in this process"""
     try:
+        chunks = []
         with pdfplumber.open(pdf_path) as pdf:
-            full_text = ""
             for page in pdf.pages:
                 page_text = page.extract_text()
+                # Drop cached layout objects so memory stays bounded per page
+                page.flush_cache()
+                if hasattr(page.get_textmap, 'cache_clear'):
+                    page.get_textmap.cache_clear()
                 if page_text:
-                    full_text += page_text + "\n"
-            return full_text
+                    chunks.append(page_text + "\n")
+        # Join once at the end instead of growing a string page by page
+        return "".join(chunks)
     except Exception as e:
         print(f"Error extracting text from {pdf_path}: {e}")
         return ""
 
+def _extract_text_pymupdf(pdf_path):
+    """Extract text from PDF with PyMuPDF's C parser"""
+    with fitz.open(pdf_path) as doc:
+        return "".join(page_text + "\n" for page_text in (page.get_text("text") for page in doc) if page_text)
+
+def extract_texts_from_pdfs(pdf_paths, backend="pymupdf"):
+    """Extract text from several PDFs, with PyMuPDF when available and pdfplumber otherwise"""
+    texts = []
+    for pdf_path in pdf_paths:
+        if backend == "pymupdf" and fitz is not None:
+            try:
+                texts.append(_extract_text_pymupdf(pdf_path))
+                continue
+            except Exception as e:
+                print(f"PyMuPDF extraction failed for {pdf_path}, falling back to pdfplumber: {e}")
+        texts.append(_extract_text_sequential(pdf_path))
+    return texts
+
+def extract_text_from_pdf(pdf_path, backend="pymupdf"):
+    """Extract text from PDF; pass backend="pdfplumber" for pdfplumber's layout-aware extraction"""
+    return extract_texts_from_pdfs([pdf_path], backend)[0]
+
+def _text_cache_path(pdf_path, backend):
+    """Cache file for pdf_path's text; any change to the file's bytes changes the name"""
+    if backend == "pymupdf" and fitz is None:
+        backend = "pdfplumber"
+    digest = hashlib.blake2b(Path(pdf_path).read_bytes(), digest_size=16).hexdigest()
+    return _TEXT_CACHE_DIR / f"{digest}-{backend}.txt"
+
+def extract_texts_cached(pdf_paths, backend="pymupdf"):
+    """Like extract_texts_from_pdfs, but reuse text extracted from identical files on earlier runs"""
+    cache_paths = []
+    texts = []
+    for pdf_path in pdf_paths:
+        try:
+            cache_path = _text_cache_path(pdf_path, backend)
+            text = None
+            if cache_path.exists():
+                with open(cache_path, 'r', encoding='utf-8', newline='') as f:
+                    text = f.read()
+        except (OSError, UnicodeDecodeError):
+            cache_path, text = None, None
+        cache_paths.append(cache_path)
+        texts.append(text)
+    
+    missing = [i for i, text in enumerate(texts) if text is None]
+    if missing:
+        extracted = extract_texts_from_pdfs([pdf_paths[i] for i in missing], backend=backend)
+        for i, text in zip(missing, extracted):
+            texts[i] = text
+            # Failed extractions come back empty and are not worth caching
+            if text and cache_paths[i] is not None:
+                try:
+                    _TEXT_CACHE_DIR.mkdir(exist_ok=True)
+                    with open(cache_paths[i], 'w', encoding='utf-8', newline='') as f:
+                        f.write(text)
+                except OSError as e:
+                    print(f"Warning: could not write text cache {cache_paths[i]}: {e}")
+    return texts
+
+_SECTIONS = ('work experience', 'education', 'skills')
+
+class AtsMetrics:
+    """ATS compatibility metrics for one document's text"""
+    __slots__ = ('chars', 'words', 'newlines', 'special', 'has_email', 'has_phone',
+                 'has_ampersands', 'has_special_bullets', 'has_non_ascii', 'sections')
+    
+    def __init__(self, text):
+        # Basic metrics (each view of the text is computed once and reused)
+        self.chars = len(text)
+        self.words = len(text.split())
+        self.newlines = text.count('\n')
+        
+        # Character analysis: for ASCII text whatever survives the table is special
+        remaining = text.translate(_ALLOWED_ASCII_TABLE)
+        self.special = len(remaining) if remaining.isascii() else len(_SPECIAL_CHARS_RE.findall(remaining))
+        
+        # ATS-specific checks. Bullets are never deleted by the table above, so
+        # they can be looked for in the (much shorter) remainder
+        self.has_non_ascii = not text.isascii()
+        self.has_ampersands = '&' in text
+        self.has_special_bullets = self.has_non_ascii and not _SPECIAL_BULLETS.isdisjoint(remaining)
+        
+        # Contact information
+        might_have_email = '@' in text
+        might_have_phone = any(digit in text for digit in _DIGITS)
+        if not (might_have_email or might_have_phone):
+            self.has_email = self.has_phone = False
+        elif _CONTACT_SET is not None and not self.has_non_ascii:
+            matched = _CONTACT_SET.Match(text) or ()
+            self.has_email = 0 in matched
+            self.has_phone = 1 in matched
+        else:
+            self.has_email = might_have_email and bool(_EMAIL_RE.search(text))
+            self.has_phone = might_have_phone and bool(_PHONE_RE.search(text))
+        
+        # Section analysis
+        text_lower = text.lower()
+        self.sections = [section for section in _SECTIONS if section in text_lower]
+    
+    @property
+    def line_count(self):
+        return self.newlines + 1
+    
+    def summary(self):
+        """Score the text and return the metrics as a dict"""
+        score = 0
+        if self.has_email: score += 25
+        if self.has_phone: score += 25
+        if len(self.sections) >= 3: score += 25
+        if not self.has_ampersands: score += 10
+        if not self.has_special_bullets: score += 10
+        if not self.has_non_ascii: score += 5
+        
+        return {
+            'text_length': self.chars,
+            'word_count': self.words,
+            'special_chars': self.special,
+            'has_ampersands': self.has_ampersands,
+            'has_special_bullets': self.has_special_bullets,
+            'has_non_ascii': self.has_non_ascii,
+            'has_email': self.has_email,
+            'has_phone': self.has_phone,
+            'sections_found': len(self.sections),
+            'ats_score': score
+        }
+
 def analyze_text(text, name):
     """Analyze text for ATS compatibility metrics"""
     print(f"\n{'='*60}")
     print(f"ANALYSIS: {name}")
     print(f"{'='*60}")
     
-    # Basic metrics
-    print(f"Text Length: {len(text)} characters")
-    print(f"Word Count: {len(text.split())} words")
-    print(f"Line Count: {len(text.split('\\n'))} lines")
-    
-    # Character analysis
-    special_chars = len(re.findall(r'[^\w\s@.-]', text))
-    print(f"Special Characters: {special_chars}")
+    metrics = AtsMetrics(text)
+    analysis = metrics.summary()
     
-    # ATS-specific checks
-    has_ampersands = '&' in text
-    has_special_bullets = any(char in text for char in ['•', '◦', '·'])
-    has_non_ascii = bool(re.search(r'[^\x00-\x7F]', text))
+    # Basic metrics
+    print(f"Text Length: {analysis['text_length']} characters")
+    print(f"Word Count: {analysis['word_count']} words")
+    print(f"Line Count: {metrics.line_count} lines")
+    print(f"Special Characters: {analysis['special_chars']}")
     
     print(f"\\nATS Compatibility Checks:")
-    print(f"  Ampersands (&): {'❌ Found' if has_ampersands else '✅ None'}")
-    print(f"  Special Bullets: {'❌ Found' if has_special_bullets else '✅ None'}")
-    print(f"  Non-ASCII Chars: {'❌ Found' if has_non_ascii else '✅ None'}")
-    
-    # Contact information
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    phone_pattern = r'(\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'
-    
-    has_email = bool(re.search(email_pattern, text))
-    has_phone = bool(re.search(phone_pattern, text))
+    print(f"  Ampersands (&): {'❌ Found' if analysis['has_ampersands'] else '✅ None'}")
+    print(f"  Special Bullets: {'❌ Found' if analysis['has_special_bullets'] else '✅ None'}")
+    print(f"  Non-ASCII Chars: {'❌ Found' if analysis['has_non_ascii'] else '✅ None'}")
     
     print(f"\\nContact Information:")
-    print(f"  Email: {'✅ Found' if has_email else '❌ Missing'}")
-    print(f"  Phone: {'✅ Found' if has_phone else '❌ Missing'}")
-    
-    # Section analysis
-    sections = ['work experience', 'education', 'skills']
-    found_sections = []
-    
-    for section in sections:
-        if section.lower() in text.lower():
-            found_sections.append(section)
+    print(f"  Email: {'✅ Found' if analysis['has_email'] else '❌ Missing'}")
+    print(f"  Phone: {'✅ Found' if analysis['has_phone'] else '❌ Missing'}")
     
+    found_sections = metrics.sections
     print(f"\\nSections Found: {', '.join(found_sections) if found_sections else 'None'}")
     
-    # Calculate ATS score
-    score = 0
-    if has_email: score += 25
-    if has_phone: score += 25
-    if len(found_sections) >= 3: score += 25
-    if not has_ampersands: score += 10
-    if not has_special_bullets: score += 10
-    if not has_non_ascii: score += 5
-    
-    print(f"\\nATS Score: {score}/100")
-    
-    return {
-        'text_length': len(text),
-        'word_count': len(text.split()),
-        'special_chars': special_chars,
-        'has_ampersands': has_ampersands,
-        'has_special_bullets': has_special_bullets,
-        'has_non_ascii': has_non_ascii,
-        'has_email': has_email,
-        'has_phone': has_phone,
-        'sections_found': len(found_sections),
-        'ats_score': score
-    }
+    print(f"\\nATS Score: {analysis['ats_score']}/100")
+    
+    return analysis
 
 def compare_resumes(original_path, optimized_path):
     """Compare original and optimized resumes"""
     print("RESUME COMPARISON ANALYSIS")
     print("="*60)
     
-    # Extract text from both PDFs
-    original_text = extract_text_from_pdf(original_path)
-    optimized_text = extract_text_from_pdf(optimized_path)
+    # Extract (or load cached) text for both PDFs in one batch
+    original_text, optimized_text = extract_texts_cached([original_path, optimized_path])
     
     if not original_text:
         print(f"Error: Could not extract text from {original_path}")
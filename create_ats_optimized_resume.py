@@ -6,9 +6,63 @@ This script creates an ATS-optimized version of the resume
 that maintains human readability while improving ATS compatibility.
 """
 
-import re
+import hashlib
 from pathlib import Path
 
+# Single-pass replacements for characters that can trip up ATS parsers
+_ATS_TRANSLATION = str.maketrans({
+    '&': 'and',
+    '•': '*', '◦': '*', '·': '*',
+    '\u2013': '-', '\u2014': '-',      # en and em dashes
+    '\u201c': '"', '\u201d': '"',      # curly double quotes
+    '\u2018': "'", '\u2019': "'"       # curly single quotes
+})
+
+def _normalize_whitespace(content: str) -> str:
+    """Collapse runs of spaces within each line and runs of blank lines, keeping indentation"""
+    lines = []
+    for line in content.split('\n'):
+        stripped = line.lstrip()
+        if stripped:
+            lines.append(line[:len(line) - len(stripped)] + ' '.join(stripped.split()))
+        elif lines and lines[-1]:
+            lines.append('')  # Keep a single blank line between blocks
+    return '\n'.join(lines)
+
+# Sidecar next to each output recording which source (and optimizer version) produced it
+_SOURCE_HASH_SUFFIX = '.atshash'
+_OPTIMIZER_VERSION = 1
+
+def _source_stamp(content: str, kind: str) -> str:
+    """Digest of the source text and the transform applied to it"""
+    digest = hashlib.blake2b(content.encode('utf-8'), digest_size=8)
+    digest.update(f"{kind}:{_OPTIMIZER_VERSION}".encode('ascii'))
+    return digest.hexdigest()
+
+def _load_if_current(output_file: str, stamp: str):
+    """Return the existing output if it was produced from the same source and left untouched, else None"""
+    try:
+        with open(output_file + _SOURCE_HASH_SUFFIX, 'r', encoding='ascii') as f:
+            recorded = f.read().split()
+        output_stat = Path(output_file).stat()
+        if recorded != [stamp, str(output_stat.st_size), str(output_stat.st_mtime_ns)]:
+            return None
+        with open(output_file, 'r', encoding='utf-8') as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+def _write_output(output_file: str, optimized_content: str, stamp: str):
+    """Write the optimized output and record the source it came from (best effort)"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(optimized_content)
+    try:
+        output_stat = Path(output_file).stat()
+        with open(output_file + _SOURCE_HASH_SUFFIX, 'w', encoding='ascii') as f:
+            f.write(f"{stamp} {output_stat.st_size} {output_stat.st_mtime_ns}\n")
+    except OSError as e:
+        print(f"Warning: could not write source hash for {output_file}: {e}")
+
 def create_ats_optimized_resume(input_file: str, output_file: str):
     """Create an ATS-optimized version of the resume"""
     
@@ -16,25 +70,21 @@ def create_ats_optimized_resume(input_file: str, output_file: str):
     with open(input_file, 'r', encoding='utf-8') as f:
         content = f.read()
     
+    # Leave the output (and everything built from it) alone if the source hasn't changed
+    stamp = _source_stamp(content, 'latex')
+    existing = _load_if_current(output_file, stamp)
+    if existing is not None:
+        print(f"ATS-optimized resume up to date: {output_file}")
+        return existing
+    
     # Apply ATS optimizations
     optimized_content = content
     
-    # 1. Replace ampersands with 'and'
+    # 1. Replace escaped LaTeX ampersands with 'and' first, so no backslash is left behind
     optimized_content = optimized_content.replace('\\&', 'and')
-    optimized_content = optimized_content.replace('&', 'and')
     
-    # 2. Replace special characters that might cause ATS issues
-    optimized_content = optimized_content.replace('•', '*')
-    optimized_content = optimized_content.replace('◦', '*')
-    optimized_content = optimized_content.replace('·', '*')
-    
-    # 3. Remove or replace non-ASCII characters
-    optimized_content = optimized_content.replace('–', '-')
-    optimized_content = optimized_content.replace('—', '-')
-    optimized_content = optimized_content.replace('"', '"')
-    optimized_content = optimized_content.replace('"', '"')
-    optimized_content = optimized_content.replace(''', "'")
-    optimized_content = optimized_content.replace(''', "'")
+    # 2-3. Replace remaining ampersands, special bullets and non-ASCII punctuation in one pass
+    optimized_content = optimized_content.translate(_ATS_TRANSLATION)
     
     # 4. Ensure consistent formatting for work experience
     # This is more complex and would require parsing the LaTeX structure
@@ -43,8 +93,7 @@ def create_ats_optimized_resume(input_file: str, output_file: str):
     # Replace cvsection with more ATS-friendly formatting
     
     # Write the optimized version
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(optimized_content)
+    _write_output(output_file, optimized_content, stamp)
     
     print(f"ATS-optimized resume created: {output_file}")
     return optimized_content
@@ -56,36 +105,28 @@ def create_ats_optimized_markdown(input_file: str, output_file: str):
     with open(input_file, 'r', encoding='utf-8') as f:
         content = f.read()
     
+    # Leave the output (and everything built from it) alone if the source hasn't changed
+    stamp = _source_stamp(content, 'markdown')
+    existing = _load_if_current(output_file, stamp)
+    if existing is not None:
+        print(f"ATS-optimized Markdown up to date: {output_file}")
+        return existing
+    
     # Apply ATS optimizations
     optimized_content = content
     
-    # 1. Replace ampersands with 'and'
-    optimized_content = optimized_content.replace('&', 'and')
-    
-    # 2. Replace special bullet points
-    optimized_content = optimized_content.replace('•', '*')
-    optimized_content = optimized_content.replace('◦', '*')
-    optimized_content = optimized_content.replace('·', '*')
-    
-    # 3. Remove or replace non-ASCII characters
-    optimized_content = optimized_content.replace('–', '-')
-    optimized_content = optimized_content.replace('—', '-')
-    optimized_content = optimized_content.replace('"', '"')
-    optimized_content = optimized_content.replace('"', '"')
-    optimized_content = optimized_content.replace(''', "'")
-    optimized_content = optimized_content.replace(''', "'")
+    # 1-3. Replace ampersands, special bullets and non-ASCII punctuation in one pass
+    optimized_content = optimized_content.translate(_ATS_TRANSLATION)
     
     # 4. Ensure consistent formatting
-    # Remove extra spaces and normalize whitespace
-    optimized_content = re.sub(r'\s+', ' ', optimized_content)
-    optimized_content = re.sub(r'\n\s*\n', '\n\n', optimized_content)
+    # Remove extra spaces and blank lines without flattening the document
+    optimized_content = _normalize_whitespace(optimized_content)
     
     # 5. Add ATS-friendly keywords
     # This could be expanded to add industry-specific keywords
     
     # Write the optimized version
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(optimized_content)
+    _write_output(output_file, optimized_content, stamp)
     
     print(f"ATS-optimized Markdown created: {output_file}")
     return optimized_content
@@ -8,15 +8,51 @@ by parsing the Definition List format and generating clean, structured text.
 
 import re
 import json
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Any
 
+try:
+    import yaml
+    # BaseLoader keeps every scalar as written (no int/bool/float/date
+    # resolution); libyaml's C version when PyYAML was built with it
+    _YAML_LOADER = getattr(yaml, 'CBaseLoader', yaml.BaseLoader)
+except ImportError:
+    yaml = None
+
+# Classifies a work-experience line by its prefix in one match: a bold job
+# title, a ": Company | Dates" line, or a "*   " achievement bullet
+_WORK_LINE_RE = re.compile(r'(?P<title>\*\*)|(?P<company>: )|(?P<achievement>\*   )')
+
+# Section keywords indexed up front; others are indexed on first use
+_SECTION_KEYWORDS = ('work experience', 'education', 'skills')
+
+@dataclass(slots=True)
+class Job:
+    title: str = ''
+    company: str = ''
+    dates: str = ''
+    achievements: List[str] = field(default_factory=list)
+
+@dataclass(slots=True)
+class Education:
+    institution: str = ''
+    location: str = ''
+    dates: str = ''
+    degree: str = ''
+
+@dataclass(slots=True)
+class SkillCategory:
+    name: str = ''
+    skills: List[str] = field(default_factory=list)
+
 class ResumeData:
     def __init__(self):
         self.contact_info = {}
-        self.work_experience = []
-        self.education = []
-        self.skills = []
+        self.work_experience: List[Job] = []
+        self.education: List[Education] = []
+        self.skills: List[SkillCategory] = []
         self.name = ""
         self.tagline = ""
 
@@ -25,6 +61,12 @@ class MarkdownToATSConverter:
         self.markdown_file = markdown_file
         self.resume_data = ResumeData()
         
+        # Line index of the content being parsed, built once by _index_sections
+        self._indexed_content = None
+        self._lines = []
+        self._lines_lower = []
+        self._section_index = {}
+        
     def parse_markdown(self) -> ResumeData:
         """Parse Markdown file and extract structured data"""
         with open(self.markdown_file, 'r', encoding='utf-8') as f:
@@ -49,18 +91,31 @@ class MarkdownToATSConverter:
         frontmatter_match = re.search(r'^---\n(.*?)\n---', content, re.DOTALL)
         if frontmatter_match:
             frontmatter = frontmatter_match.group(1)
-            lines = frontmatter.split('\n')
-            for line in lines:
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if key == 'name':
-                        self.resume_data.name = value
-                    elif key == 'subtitle':
-                        self.resume_data.tagline = value
-                    else:
-                        self.resume_data.contact_info[key] = value
+            for key, value in self._frontmatter_items(frontmatter):
+                if key == 'name':
+                    self.resume_data.name = value
+                elif key == 'subtitle':
+                    self.resume_data.tagline = value
+                else:
+                    self.resume_data.contact_info[key] = value
+    
+    def _frontmatter_items(self, frontmatter: str) -> List[tuple]:
+        """Return (key, value) string pairs, parsed as YAML when PyYAML is available"""
+        if yaml is not None:
+            try:
+                data = yaml.load(frontmatter, Loader=_YAML_LOADER)
+            except yaml.YAMLError:
+                data = None
+            if isinstance(data, dict):
+                return [(str(key), '' if value is None else str(value)) for key, value in data.items()]
+        
+        # Fallback: simple "key: value" lines
+        items = []
+        for line in frontmatter.split('\n'):
+            if ':' in line:
+                key, value = line.split(':', 1)
+                items.append((key.strip(), value.strip()))
+        return items
     
     def _parse_work_experience(self, content: str):
         """Parse work experience section using Definition List format"""
@@ -72,55 +127,49 @@ class MarkdownToATSConverter:
         # Parse each job entry
         lines = work_section.split('\n')
         current_job = None
+        match_line = _WORK_LINE_RE.match  # Bound once rather than looked up per line
         
         for line in lines:
             line = line.strip()
             if not line:
                 continue
             
-            # Check if this is a job title (bold text)
-            if line.startswith('**') and line.endswith('**'):
+            match = match_line(line)
+            if not match:
+                continue  # Separators and free text
+            kind = match.lastgroup
+            
+            # Check if this is a job title (bold text). Bold-italic "***...***" lines
+            # also end up here, so they are treated as titles too
+            if kind == 'title':
+                if not line.endswith('**'):
+                    continue
+                
                 # Save previous job if exists
                 if current_job:
                     self.resume_data.work_experience.append(current_job)
                 
                 # Start new job
                 job_title = line[2:-2]  # Remove ** markers
-                current_job = {
-                    'title': job_title,
-                    'company': '',
-                    'dates': '',
-                    'achievements': []
-                }
+                current_job = Job(title=job_title)
             
             # Check if this is a company/date line (starts with :)
-            elif line.startswith(': '):
+            elif kind == 'company':
                 if current_job:
                     # Parse "Company | _Date Range_" format
                     company_dates = line[2:]  # Remove ": "
                     if ' | ' in company_dates:
                         company, dates = company_dates.split(' | ', 1)
-                        current_job['company'] = company.strip()
+                        current_job.company = company.strip()
                         # Remove _ markers from dates
-                        current_job['dates'] = dates.replace('_', '').strip()
+                        current_job.dates = dates.replace('_', '').strip()
                     else:
-                        current_job['company'] = company_dates.strip()
-            
-            # Check if this is a project subheading
-            elif line.startswith('***') and line.endswith('***'):
-                if current_job:
-                    project_title = line[3:-3]  # Remove *** markers
-                    current_job['achievements'].append(f"Project: {project_title}")
+                        current_job.company = company_dates.strip()
             
-            # Check if this is an achievement (starts with *)
-            elif line.startswith('*   '):
-                if current_job:
-                    achievement = line[4:].strip()  # Remove "*   " prefix
-                    current_job['achievements'].append(achievement)
-            
-            # Skip separator lines
-            elif line.startswith('---'):
-                continue
+            # Otherwise this is an achievement (starts with "*   ")
+            elif current_job:
+                achievement = line[4:].strip()  # Remove "*   " prefix
+                current_job.achievements.append(achievement)
         
         # Add the last job
         if current_job:
@@ -148,18 +197,13 @@ class MarkdownToATSConverter:
                     location = parts[1].strip()
                     dates = parts[2].replace('_', '').strip()
                     
-                    current_edu = {
-                        'institution': institution,
-                        'location': location,
-                        'dates': dates,
-                        'degree': ''
-                    }
+                    current_edu = Education(institution=institution, location=location, dates=dates)
             
             # Check for degree on next line
             elif line.startswith('*   '):
                 degree = line[4:].strip()
                 if current_edu:
-                    current_edu['degree'] = degree
+                    current_edu.degree = degree
                     self.resume_data.education.append(current_edu)
                     current_edu = None
     
@@ -183,10 +227,7 @@ class MarkdownToATSConverter:
                     self.resume_data.skills.append(current_category)
                 
                 category_name = line[2:-2]  # Remove ** markers
-                current_category = {
-                    'name': category_name,
-                    'skills': []
-                }
+                current_category = SkillCategory(name=category_name)
             
             # Check if this is a skills list
             elif current_category and '•' in line:
@@ -195,131 +236,126 @@ class MarkdownToATSConverter:
                 for item in skill_items:
                     item = item.strip()
                     if item:
-                        current_category['skills'].append(item)
+                        current_category.skills.append(item)
         
         # Add the last category
         if current_category:
             self.resume_data.skills.append(current_category)
     
+    def _index_sections(self, content: str):
+        """Split and lowercase the content once, recording which lines mention each section keyword"""
+        if content is self._indexed_content:
+            return
+        
+        self._indexed_content = content
+        self._lines = content.split('\n')
+        # Lowercasing never adds or removes newlines, so this lines up with self._lines
+        self._lines_lower = content.lower().split('\n')
+        self._section_index = {}
+        for keyword in _SECTION_KEYWORDS:
+            self._keyword_lines(keyword)
+    
+    def _keyword_lines(self, keyword: str) -> List[int]:
+        """Indices of the lines containing keyword (lowercase), computed once per keyword"""
+        hits = self._section_index.get(keyword)
+        if hits is None:
+            hits = [i for i, line in enumerate(self._lines_lower) if keyword in line]
+            self._section_index[keyword] = hits
+        return hits
+    
     def _extract_section(self, content: str, start_keyword: str, end_keyword: str) -> str:
         """Extract a specific section from the content"""
-        lines = content.split('\n')
-        start_idx = -1
-        end_idx = len(lines)
+        self._index_sections(content)
         
         # Find start of section
-        for i, line in enumerate(lines):
-            if start_keyword.lower() in line.lower():
-                start_idx = i
-                break
-        
-        if start_idx == -1:
+        start_hits = self._keyword_lines(start_keyword.lower())
+        if not start_hits:
             return ""
+        start_idx = start_hits[0]
         
-        # Find end of section
+        # Find end of section: the first end keyword after the start
+        end_idx = len(self._lines)
         if end_keyword:
-            for i in range(start_idx + 1, len(lines)):
-                if end_keyword.lower() in lines[i].lower():
-                    end_idx = i
-                    break
+            end_hits = self._keyword_lines(end_keyword.lower())
+            pos = bisect_right(end_hits, start_idx)
+            if pos < len(end_hits):
+                end_idx = end_hits[pos]
         
         # Extract section
-        section_lines = lines[start_idx:end_idx]
-        return '\n'.join(section_lines)
+        return '\n'.join(self._lines[start_idx:end_idx])
     
     def generate_ats_text(self) -> str:
         """Generate ATS-friendly text from parsed data"""
-        ats_text = []
+        data = self.resume_data
         
         # Header
-        ats_text.append(f"NAME: {self.resume_data.name}")
-        ats_text.append(f"TITLE: {self.resume_data.tagline}")
-        ats_text.append("")
+        ats_text = [f"NAME: {data.name}", f"TITLE: {data.tagline}", ""]
         
         # Contact Information
         ats_text.append("CONTACT INFORMATION:")
-        for key, value in self.resume_data.contact_info.items():
-            if value:
-                ats_text.append(f"{key.upper()}: {value}")
+        ats_text += [f"{key.upper()}: {value}" for key, value in data.contact_info.items() if value]
         ats_text.append("")
         
         # Work Experience
         ats_text.append("WORK EXPERIENCE:")
-        for job in self.resume_data.work_experience:
-            ats_text.append(f"JOB TITLE: {job['title']}")
-            ats_text.append(f"COMPANY: {job['company']}")
-            ats_text.append(f"DATES: {job['dates']}")
-            if job['achievements']:
+        for job in data.work_experience:
+            ats_text += [f"JOB TITLE: {job.title}", f"COMPANY: {job.company}", f"DATES: {job.dates}"]
+            if job.achievements:
                 ats_text.append("ACHIEVEMENTS:")
-                for achievement in job['achievements']:
-                    ats_text.append(f"- {achievement}")
+                ats_text += [f"- {achievement}" for achievement in job.achievements]
             ats_text.append("")
         
         # Education
         ats_text.append("EDUCATION:")
-        for edu in self.resume_data.education:
-            ats_text.append(f"DEGREE: {edu['degree']}")
-            ats_text.append(f"INSTITUTION: {edu['institution']}")
-            ats_text.append(f"LOCATION: {edu['location']}")
-            ats_text.append(f"DATES: {edu['dates']}")
-            ats_text.append("")
+        for edu in data.education:
+            ats_text += [
+                f"DEGREE: {edu.degree}",
+                f"INSTITUTION: {edu.institution}",
+                f"LOCATION: {edu.location}",
+                f"DATES: {edu.dates}",
+                ""
+            ]
         
         # Skills
         ats_text.append("SKILLS:")
-        for category in self.resume_data.skills:
-            skills_list = ", ".join(category['skills'])
-            ats_text.append(f"{category['name'].upper()}: {skills_list}")
+        ats_text += [f"{category.name.upper()}: {', '.join(category.skills)}" for category in data.skills]
         ats_text.append("")
         
         return '\n'.join(ats_text)
     
     def generate_ats_optimized_text(self) -> str:
         """Generate ATS-optimized text with better parsing format"""
-        ats_text = []
+        data = self.resume_data
+        contact_info = data.contact_info
         
         # Header
-        ats_text.append(f"{self.resume_data.name}")
-        ats_text.append(f"{self.resume_data.tagline}")
-        ats_text.append("")
+        ats_text = [data.name, data.tagline, ""]
         
         # Contact Information
-        contact_parts = []
-        if self.resume_data.contact_info.get('email'):
-            contact_parts.append(self.resume_data.contact_info['email'])
-        if self.resume_data.contact_info.get('phone'):
-            contact_parts.append(self.resume_data.contact_info['phone'])
-        if self.resume_data.contact_info.get('location'):
-            contact_parts.append(self.resume_data.contact_info['location'])
-        if self.resume_data.contact_info.get('linkedin'):
-            contact_parts.append(f"LinkedIn: {self.resume_data.contact_info['linkedin']}")
-        
-        ats_text.append(" | ".join(contact_parts))
-        ats_text.append("")
+        contact_parts = [contact_info[key] for key in ('email', 'phone', 'location') if contact_info.get(key)]
+        if contact_info.get('linkedin'):
+            contact_parts.append(f"LinkedIn: {contact_info['linkedin']}")
+        
+        ats_text += [" | ".join(contact_parts), ""]
         
         # Work Experience - ATS-friendly format
         ats_text.append("WORK EXPERIENCE")
-        for job in self.resume_data.work_experience:
-            # Format: Job Title: Company | Dates
-            ats_text.append(f"{job['title']}: {job['company']} | {job['dates']}")
-            
-            # Add achievements as bullet points
-            for achievement in job['achievements']:
-                ats_text.append(f"* {achievement}")
+        for job in data.work_experience:
+            # Format: Job Title: Company | Dates, then achievements as bullet points
+            ats_text.append(f"{job.title}: {job.company} | {job.dates}")
+            ats_text += [f"* {achievement}" for achievement in job.achievements]
             ats_text.append("")
         
         # Education - ATS-friendly format
         ats_text.append("EDUCATION")
-        for edu in self.resume_data.education:
-            # Format: Degree: Institution | Dates
-            ats_text.append(f"{edu['degree']}: {edu['institution']} | {edu['dates']}")
+        # Format: Degree: Institution | Dates
+        ats_text += [f"{edu.degree}: {edu.institution} | {edu.dates}" for edu in data.education]
         ats_text.append("")
         
         # Skills - ATS-friendly format
         ats_text.append("SKILLS")
-        for category in self.resume_data.skills:
-            # Format: Category: skill1, skill2, skill3
-            skills_list = ", ".join(category['skills'])
-            ats_text.append(f"{category['name']}: {skills_list}")
+        # Format: Category: skill1, skill2, skill3
+        ats_text += [f"{category.name}: {', '.join(category.skills)}" for category in data.skills]
         
         return '\n'.join(ats_text)
 
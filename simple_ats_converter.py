@@ -9,6 +9,72 @@ by parsing the Markdown and generating structured text that ATS systems can pars
 import re
 from pathlib import Path
 
+# Patterns are compiled once at import time rather than on every conversion
+_NAME_RE = re.compile(r'name:\s*(.+)')
+_SUBTITLE_RE = re.compile(r'subtitle:\s*(.+)')
+_EMAIL_RE = re.compile(r'email:\s*(.+)')
+_PHONE_RE = re.compile(r'phone:\s*(.+)')
+_LOCATION_RE = re.compile(r'location:\s*(.+)')
+_LINKEDIN_RE = re.compile(r'linkedin:\s*(.+)')
+_EDUCATION_RE = re.compile(r'\*\*([^*]+)\*\*\s*\|\s*([^|]+)\s*\|\s*_([^_]+)_')
+_DEGREE_RE = re.compile(r'\*\s*([^*\n]+)')
+# Possessive runs: the category name can only be followed by '*' and the skills
+# end the match, so giving characters back could never help, only cost time
+_SKILL_CATEGORY_RE = re.compile(r'\*\*([^*]++)\*\*\s*\n([^*\n]++)')
+
+def _iter_jobs(work_section: str):
+    """Yield (title, company, dates, achievements) for each job in the work section, once it is complete"""
+    title = None  # No job started yet: company, project and achievement lines are ignored
+    company = dates = ''
+    achievements = []
+    
+    for line in work_section.split('\n'):
+        # Blank lines are skipped before paying for a stripped copy
+        if not line or line.isspace():
+            continue
+        line = line.strip()
+        
+        # Dispatch on the first character; '***' is tested before '**' so
+        # project subheadings never need ruling out as job titles
+        first = line[0]
+        if first == '*':
+            if line.startswith('***'):
+                # Project subheading
+                if line.endswith('***') and title is not None:
+                    project_title = line[3:-3]  # Remove *** markers
+                    achievements.append(f"Project: {project_title}")
+            
+            # Job title (bold text): the previous job is complete
+            elif line.startswith('**'):
+                if line.endswith('**'):
+                    if title is not None:
+                        yield title, company, dates, achievements
+                    
+                    # Start new job
+                    title = line[2:-2]  # Remove ** markers
+                    company = dates = ''
+                    achievements = []
+            
+            # Achievement (starts with *)
+            elif line.startswith('*   '):
+                if title is not None:
+                    achievements.append(line[4:].strip())  # Remove "*   " prefix
+        
+        # Company and dates (starts with :)
+        elif first == ':' and line.startswith(': '):
+            if title is not None:
+                company_dates = line[2:]  # Remove ": "
+                if ' | ' in company_dates:
+                    company, dates = company_dates.split(' | ', 1)
+                    company = company.strip()
+                    dates = dates.replace('_', '').strip()
+                else:
+                    company = company_dates.strip()
+    
+    # The last job
+    if title is not None:
+        yield title, company, dates, achievements
+
 def parse_markdown_resume(markdown_file: str) -> str:
     """Parse Markdown resume and generate ATS-friendly text"""
     
@@ -18,8 +84,8 @@ def parse_markdown_resume(markdown_file: str) -> str:
     ats_lines = []
     
     # Extract name and title
-    name_match = re.search(r'name:\s*(.+)', content)
-    title_match = re.search(r'subtitle:\s*(.+)', content)
+    name_match = _NAME_RE.search(content)
+    title_match = _SUBTITLE_RE.search(content)
     
     if name_match:
         ats_lines.append(name_match.group(1).strip())
@@ -29,10 +95,10 @@ def parse_markdown_resume(markdown_file: str) -> str:
     ats_lines.append("")
     
     # Extract contact info
-    email_match = re.search(r'email:\s*(.+)', content)
-    phone_match = re.search(r'phone:\s*(.+)', content)
-    location_match = re.search(r'location:\s*(.+)', content)
-    linkedin_match = re.search(r'linkedin:\s*(.+)', content)
+    email_match = _EMAIL_RE.search(content)
+    phone_match = _PHONE_RE.search(content)
+    location_match = _LOCATION_RE.search(content)
+    linkedin_match = _LINKEDIN_RE.search(content)
     
     contact_parts = []
     if email_match:
@@ -51,88 +117,36 @@ def parse_markdown_resume(markdown_file: str) -> str:
     # Extract work experience
     ats_lines.append("WORK EXPERIENCE")
     
-    # Find work experience section
+    # Find each section heading once; the offsets are shared by the blocks below
     work_start = content.find("### Work Experience")
     edu_start = content.find("### Education")
+    skills_start = content.find("### Skills")
     
     if work_start != -1 and edu_start != -1:
         work_section = content[work_start:edu_start]
         
         # Parse each job using Definition List format
-        lines = work_section.split('\n')
-        current_job = None
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Job title (bold text)
-            if line.startswith('**') and line.endswith('**') and not line.startswith('***'):
-                if current_job:
-                    # Format: Job Title: Company | Dates
-                    ats_lines.append(f"{current_job['title']}: {current_job['company']} | {current_job['dates']}")
-                    for achievement in current_job['achievements']:
-                        ats_lines.append(f"* {achievement}")
-                    ats_lines.append("")
-                
-                # Start new job
-                job_title = line[2:-2]  # Remove ** markers
-                current_job = {
-                    'title': job_title,
-                    'company': '',
-                    'dates': '',
-                    'achievements': []
-                }
-            
-            # Company and dates (starts with :)
-            elif line.startswith(': '):
-                if current_job:
-                    company_dates = line[2:]  # Remove ": "
-                    if ' | ' in company_dates:
-                        company, dates = company_dates.split(' | ', 1)
-                        current_job['company'] = company.strip()
-                        current_job['dates'] = dates.replace('_', '').strip()
-                    else:
-                        current_job['company'] = company_dates.strip()
-            
-            # Project subheading
-            elif line.startswith('***') and line.endswith('***'):
-                if current_job:
-                    project_title = line[3:-3]  # Remove *** markers
-                    current_job['achievements'].append(f"Project: {project_title}")
-            
-            # Achievement (starts with *)
-            elif line.startswith('*   '):
-                if current_job:
-                    achievement = line[4:].strip()  # Remove "*   " prefix
-                    current_job['achievements'].append(achievement)
-        
-        # Add the last job
-        if current_job:
-            ats_lines.append(f"{current_job['title']}: {current_job['company']} | {current_job['dates']}")
-            for achievement in current_job['achievements']:
-                ats_lines.append(f"* {achievement}")
+        for title, company, dates, achievements in _iter_jobs(work_section):
+            # Format: Job Title: Company | Dates
+            ats_lines.append(f"{title}: {company} | {dates}")
+            ats_lines.extend([f"* {achievement}" for achievement in achievements])
             ats_lines.append("")
     
     # Extract education
     ats_lines.append("EDUCATION")
     
-    edu_start = content.find("### Education")
-    skills_start = content.find("### Skills")
-    
     if edu_start != -1 and skills_start != -1:
         edu_section = content[edu_start:skills_start]
         
         # Look for education pattern: **Institution** | Location | _Dates_
-        edu_match = re.search(r'\*\*([^*]+)\*\*\s*\|\s*([^|]+)\s*\|\s*_([^_]+)_', edu_section)
+        edu_match = _EDUCATION_RE.search(edu_section)
         if edu_match:
             institution = edu_match.group(1).strip()
             location = edu_match.group(2).strip()
             dates = edu_match.group(3).strip()
             
             # Look for degree on next line
-            degree_match = re.search(r'\*\s*([^*\n]+)', edu_section)
+            degree_match = _DEGREE_RE.search(edu_section)
             if degree_match:
                 degree = degree_match.group(1).strip()
                 ats_lines.append(f"{degree}: {institution} | {dates}")
@@ -148,15 +162,11 @@ def parse_markdown_resume(markdown_file: str) -> str:
         skills_section = content[skills_start:]
         
         # Parse skill categories
-        skill_categories = re.findall(r'\*\*([^*]+)\*\*\s*\n([^*\n]+)', skills_section)
+        skill_categories = _SKILL_CATEGORY_RE.findall(skills_section)
         
         for category_name, skills_text in skill_categories:
-            # Clean up skills text
-            skills_text = skills_text.strip()
-            # Replace bullet points with commas
-            skills_text = re.sub(r'•', ',', skills_text)
-            # Clean up extra spaces
-            skills_text = re.sub(r'\s+', ' ', skills_text)
+            # Replace bullet points with commas, then trim and collapse runs of whitespace
+            skills_text = ' '.join(skills_text.replace('•', ',').split())
             
             ats_lines.append(f"{category_name.strip()}: {skills_text}")
     
@@ -189,9 +199,9 @@ def main():
     # Show sample
     print("\nGenerated ATS text:")
     print("-" * 50)
-    lines = ats_text.split('\n')
-    for line in lines[:30]:  # Show first 30 lines
-        print(line)
+    # Split off only the first 30 lines; a 31st part means there is more to elide
+    lines = ats_text.split('\n', 30)
+    print('\n'.join(lines[:30]))  # Show first 30 lines
     if len(lines) > 30:
         print("...")
 
@@ -11,6 +11,31 @@ import json
 from pathlib import Path
 from typing import Dict, List, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Patterns are compiled once at import time rather than on every check
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_RE = re.compile(r'(\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}')
+_LOCATION_RE = re.compile(r'([A-Z][a-z]+,\s*[A-Z]{2})')
+_LINKEDIN_RE = re.compile(r'LinkedIn:\s*([a-zA-Z0-9-]+)')
+
+# Section headers, written uppercase to match the uppercased text directly
+_WORK_HEADER = 'WORK EXPERIENCE'
+_EDUCATION_HEADER = 'EDUCATION'
+_SKILLS_HEADER = 'SKILLS'
+
+def _write_json(results: Dict[str, Any], output_path: str):
+    """Write results as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(results, f, indent=2)
+
 class ATSTextTester:
     def __init__(self, text_file: str):
         self.text_file = text_file
@@ -23,11 +48,19 @@ class ATSTextTester:
             'ats_issues': [],
             'optimization_score': 0
         }
+        
+        # Uppercased copy of self.text, computed once per text
+        self._upper_of = None
+        self._upper = ""
+        # The text results['contact_info'] was parsed from, so later checks can reuse it
+        self._contact_of = None
     
     def load_text(self):
         """Load text from file"""
         with open(self.text_file, 'r', encoding='utf-8') as f:
             self.text = f.read()
+        self._upper_of = self.text
+        self._upper = self.text.upper()
     
     def test_contact_info(self) -> Dict[str, Any]:
         """Test contact information parsing"""
@@ -40,41 +73,36 @@ class ATSTextTester:
             'complete': False
         }
         
-        # Extract name (first line)
-        lines = self.text.split('\n')
-        if lines:
-            contact['name'] = lines[0].strip()
+        # Extract name (first line), without splitting the rest of the text
+        contact['name'] = self.text.partition('\n')[0].strip()
         
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, self.text)
+        email_match = _EMAIL_RE.search(self.text)
         if email_match:
             contact['email'] = email_match.group(0)
         
         # Extract phone
-        phone_pattern = r'(\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'
-        phone_match = re.search(phone_pattern, self.text)
+        phone_match = _PHONE_RE.search(self.text)
         if phone_match:
             contact['phone'] = phone_match.group(0)
         
         # Extract location
-        location_pattern = r'([A-Z][a-z]+,\s*[A-Z]{2})'
-        location_match = re.search(location_pattern, self.text)
+        location_match = _LOCATION_RE.search(self.text)
         if location_match:
             contact['location'] = location_match.group(1)
         
         # Extract LinkedIn
-        linkedin_pattern = r'LinkedIn:\s*([a-zA-Z0-9-]+)'
-        linkedin_match = re.search(linkedin_pattern, self.text)
+        linkedin_match = _LINKEDIN_RE.search(self.text)
         if linkedin_match:
             contact['linkedin'] = linkedin_match.group(1)
         
         # Check if complete
-        contact['complete'] = all([
-            contact['name'], contact['email'], contact['phone'], contact['location']
-        ])
+        contact['complete'] = bool(
+            contact['name'] and contact['email'] and contact['phone'] and contact['location']
+        )
         
         self.results['contact_info'] = contact
+        self._contact_of = self.text
         return contact
     
     def test_work_experience(self) -> Dict[str, Any]:
@@ -86,19 +114,19 @@ class ATSTextTester:
         }
         
         # Find work experience section
-        work_section = self._extract_section('WORK EXPERIENCE', 'EDUCATION')
+        work_section = self._extract_section(_WORK_HEADER, _EDUCATION_HEADER)
         if not work_section:
             experience['issues'].append("Work experience section not found")
             return experience
         
         # Parse jobs using the ATS-friendly format
-        lines = work_section.split('\n')
         current_job = None
         
-        for line in lines:
-            line = line.strip()
-            if not line:
+        for line in work_section.split('\n'):
+            # Blank lines are skipped before paying for a stripped copy
+            if not line or line.isspace():
                 continue
+            line = line.strip()
             
             # Check if this is a job entry (format: Job Title: Company | Dates)
             if ':' in line and '|' in line and not line.startswith('*'):
@@ -106,7 +134,7 @@ class ATSTextTester:
                     experience['jobs'].append(current_job)
                 
                 # Parse job title, company, dates
-                parts = line.split(':')
+                parts = line.split(':', 2)  # Only the first two fields are used
                 if len(parts) >= 2:
                     job_title = parts[0].strip()
                     company_dates = parts[1].strip()
@@ -137,10 +165,13 @@ class ATSTextTester:
         if current_job:
             experience['jobs'].append(current_job)
         
-        # Check if parsing was successful
-        experience['parsed_well'] = len(experience['jobs']) > 0 and all(
-            job['title'] and job['company'] for job in experience['jobs']
-        )
+        # Check if parsing was successful: at least one job, each with a title and company
+        parsed_well = bool(experience['jobs'])
+        for job in experience['jobs']:
+            if not (job['title'] and job['company']):
+                parsed_well = False
+                break
+        experience['parsed_well'] = parsed_well
         
         if not experience['parsed_well']:
             experience['issues'].append("Work experience not parsed correctly")
@@ -157,21 +188,20 @@ class ATSTextTester:
         }
         
         # Find education section
-        edu_section = self._extract_section('EDUCATION', 'SKILLS')
+        edu_section = self._extract_section(_EDUCATION_HEADER, _SKILLS_HEADER)
         if not edu_section:
             education['issues'].append("Education section not found")
             return education
         
         # Parse education entries
-        lines = edu_section.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
+        for line in edu_section.split('\n'):
+            if not line or line.isspace():
                 continue
+            line = line.strip()
             
             # Look for education pattern: Degree: Institution | Dates
             if ':' in line and '|' in line:
-                parts = line.split(':')
+                parts = line.split(':', 2)
                 if len(parts) >= 2:
                     degree = parts[0].strip()
                     institution_dates = parts[1].strip()
@@ -208,17 +238,16 @@ class ATSTextTester:
         }
         
         # Find skills section
-        skills_section = self._extract_section('SKILLS', '')
+        skills_section = self._extract_section(_SKILLS_HEADER, '')
         if not skills_section:
             skills['issues'].append("Skills section not found")
             return skills
         
         # Parse skill categories
-        lines = skills_section.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
+        for line in skills_section.split('\n'):
+            if not line or line.isspace():
                 continue
+            line = line.strip()
             
             # Look for skill category pattern: Category: skill1, skill2, skill3
             if ':' in line:
@@ -235,10 +264,13 @@ class ATSTextTester:
                         'skills': skill_items
                     })
         
-        # Check if parsing was successful
-        skills['parsed_well'] = len(skills['skill_categories']) > 0 and any(
-            len(cat['skills']) > 0 for cat in skills['skill_categories']
-        )
+        # Check if parsing was successful: some category has at least one skill
+        parsed_well = False
+        for cat in skills['skill_categories']:
+            if cat['skills']:
+                parsed_well = True
+                break
+        skills['parsed_well'] = parsed_well
         
         if not skills['parsed_well']:
             skills['issues'].append("Skills not parsed correctly")
@@ -248,13 +280,43 @@ class ATSTextTester:
     
     def _extract_section(self, start_keyword: str, end_keyword: str) -> str:
         """Extract a specific section from the text"""
+        text = self.text
+        if self._upper_of is not text:
+            self._upper_of = text
+            self._upper = text.upper()
+        text_upper = self._upper
+        if len(text_upper) != len(text):
+            # Some characters uppercase to several (e.g. 'ß'), so offsets don't carry over
+            return self._extract_section_by_lines(start_keyword, end_keyword)
+        
+        # Find start of section, widened to the start of its line
+        keyword_pos = text_upper.find(start_keyword.upper())
+        if keyword_pos == -1:
+            return ""
+        start = text.rfind('\n', 0, keyword_pos) + 1
+        end = len(text)
+        
+        # Find end of section: the line before the first later line with end_keyword
+        if end_keyword:
+            next_line = text.find('\n', keyword_pos)
+            if next_line != -1:
+                end_pos = text_upper.find(end_keyword.upper(), next_line + 1)
+                if end_pos != -1:
+                    end = text.rfind('\n', 0, end_pos)
+        
+        return text[start:end]
+    
+    def _extract_section_by_lines(self, start_keyword: str, end_keyword: str) -> str:
+        """Line-by-line _extract_section, for text whose length changes when uppercased"""
         lines = self.text.split('\n')
+        lines_upper = self._upper.split('\n')
         start_idx = -1
         end_idx = len(lines)
         
         # Find start of section
-        for i, line in enumerate(lines):
-            if start_keyword.upper() in line.upper():
+        start_keyword = start_keyword.upper()
+        for i, line in enumerate(lines_upper):
+            if start_keyword in line:
                 start_idx = i
                 break
         
@@ -263,8 +325,9 @@ class ATSTextTester:
         
         # Find end of section
         if end_keyword:
+            end_keyword = end_keyword.upper()
             for i in range(start_idx + 1, len(lines)):
-                if end_keyword.upper() in lines[i].upper():
+                if end_keyword in lines_upper[i]:
                     end_idx = i
                     break
         
@@ -275,51 +338,47 @@ class ATSTextTester:
     def identify_ats_issues(self) -> List[str]:
         """Identify ATS parsing issues"""
         issues = []
+        # str knows whether it is pure ASCII, so this costs no scan of the text
+        is_ascii = self.text.isascii()
         
         # Check for problematic characters
         if '&' in self.text:
             issues.append("Ampersands (&) should be written as 'and' for better ATS compatibility")
         
-        if '•' in self.text or '◦' in self.text:
+        if not is_ascii and ('•' in self.text or '◦' in self.text):
             issues.append("Special bullet points may not parse well in some ATS systems")
         
-        if re.search(r'[^\x00-\x7F]', self.text):
+        if not is_ascii:
             issues.append("Non-ASCII characters may cause ATS parsing issues")
         
-        # Check for missing contact info
-        if not re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', self.text):
+        # Check for missing contact info, reusing test_contact_info's matches when it
+        # has already searched this text (a match is never empty)
+        if self._contact_of is self.text:
+            has_email = bool(self.results['contact_info']['email'])
+            has_phone = bool(self.results['contact_info']['phone'])
+        else:
+            has_email = bool(_EMAIL_RE.search(self.text))
+            has_phone = bool(_PHONE_RE.search(self.text))
+        
+        if not has_email:
             issues.append("Email address not found - critical for ATS")
         
-        if not re.search(r'(\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}', self.text):
+        if not has_phone:
             issues.append("Phone number not found - important for ATS")
         
         return issues
     
     def calculate_optimization_score(self) -> int:
         """Calculate ATS optimization score"""
-        score = 0
-        
-        # Contact info (25 points)
-        if self.results['contact_info']['complete']:
-            score += 25
-        
-        # Work experience (30 points)
-        if self.results['work_experience']['parsed_well']:
-            score += 30
-        
-        # Education (20 points)
-        if self.results['education']['parsed_well']:
-            score += 20
-        
-        # Skills (15 points)
-        if self.results['skills']['parsed_well']:
-            score += 15
-        
-        # No ATS issues (10 points)
-        if len(self.results['ats_issues']) == 0:
-            score += 10
-        
-        return score
+        results = self.results
+        # Each check is a bool, so its points are simply weight * check
+        return (
+            25 * results['contact_info']['complete']            # Contact info
+            + 30 * results['work_experience']['parsed_well']    # Work experience
+            + 20 * results['education']['parsed_well']          # Education
+            + 15 * results['skills']['parsed_well']             # Skills
+            + 10 * (not results['ats_issues'])                  # No ATS issues
+        )
     
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all ATS tests"""
@@ -435,8 +494,7 @@ def main():
     tester.print_results()
     
     # Save results
-    with open('ats_text_test_results.json', 'w') as f:
-        json.dump(results, f, indent=2)
+    _write_json(results, 'ats_text_test_results.json')
     
     print(f"\nDetailed results saved to: ats_text_test_results.json")
 